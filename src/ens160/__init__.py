@@ -3,8 +3,12 @@
 """
 
 from .icommunication import ICommunication
+from .iinterrupt import IInterrupt
 from .commands import Commands
+from .interrupt_config import InterruptConfig
 from .op_modes import OpModes
 from .registers import Registers
 from .status import Status
 from .driver import Driver
+from .streamer import Streamer
+from .async_driver import AsyncDriver
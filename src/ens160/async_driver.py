@@ -0,0 +1,161 @@
+"""
+ENS160 asyncio driver
+"""
+
+import asyncio
+from time import monotonic
+
+from .backoff import backoff
+from .driver import Driver
+from .icommunication import ICommunication
+from .iinterrupt import IInterrupt
+from .interrupt_config import InterruptConfig
+from .op_modes import OpModes
+from .status import Status
+
+
+class AsyncDriver:
+    """ENS160 Sensor class for asyncio applications.
+
+    Mirrors the `ens160.Driver` API by running its methods in the default executor, one
+    at a time. Waiting for the device uses asyncio.sleep between those calls so
+    the event loop keeps running other tasks."""
+
+    PART_ID = Driver.PART_ID
+    """The PART_ID as of the ENS160."""
+
+    def __init__(self, communication: ICommunication):
+        """Constructor for the class which takes an `ens160.ICommunication` object
+        to provide the communications, see `ens160.Driver`."""
+        self.__driver = Driver(communication)
+        self.__lock = asyncio.Lock()
+
+    async def __call(self, function, *args):
+        """Runs a blocking call in the executor, one at a time."""
+        async with self.__lock:
+            return await asyncio.to_thread(function, *args)
+
+    async def __poll(self, condition, deadline: float) -> bool:
+        """Calls the blocking condition with exponential backoff until it returns
+        True or time.monotonic() passes deadline."""
+        for delay in backoff(0.001, 0.05):
+            if await self.__call(condition):
+                return True
+            if monotonic() > deadline:
+                return False
+            await asyncio.sleep(delay)
+        return False
+
+    async def set_operating_mode(self, mode: OpModes):
+        """See `ens160.Driver.set_operating_mode`."""
+        await self.__call(self.__driver.set_operating_mode, mode)
+
+    async def get_operating_mode(self) -> OpModes:
+        """See `ens160.Driver.get_operating_mode`."""
+        return await self.__call(self.__driver.get_operating_mode)
+
+    async def get_part_id(self) -> int:
+        """See `ens160.Driver.get_part_id`."""
+        return await self.__call(self.__driver.get_part_id)
+
+    async def clear_gp_read_flag(self):
+        """See `ens160.Driver.clear_gp_read_flag`."""
+        await self.__call(self.__driver.clear_gp_read_flag)
+
+    async def get_fw_version(self) -> str:
+        """See `ens160.Driver.get_fw_version`."""
+        deadline = monotonic() + Driver.FW_VERSION_TIMEOUT
+        await self.__call(self.__driver.request_fw_version)
+        await self.__wait_interrupt(Driver.FW_VERSION_TIMEOUT)
+        if not await self.__poll(self.__driver.fw_version_ready, deadline):
+            raise TimeoutError("ENS160 did not report the firmware version.")
+        return await self.__call(self.__driver.read_fw_version)
+
+    async def __wait_interrupt(self, timeout: float) -> bool:
+        """Waits on the configured interrupt pin, if any, without holding the
+        bus. Returns False when no interrupt is configured."""
+        interrupt = self.__driver.interrupt
+        if interrupt is None:
+            return False
+        await asyncio.to_thread(interrupt.wait, timeout)
+        return True
+
+    async def set_temp_compensation_kelvin(self, t_in_kelvin: float):
+        """See `ens160.Driver.set_temp_compensation_kelvin`."""
+        await self.__call(self.__driver.set_temp_compensation_kelvin, t_in_kelvin)
+
+    async def set_temp_compensation_celcius(self, t_in_celcius: float):
+        """See `ens160.Driver.set_temp_compensation_celcius`."""
+        await self.__call(self.__driver.set_temp_compensation_celcius, t_in_celcius)
+
+    async def set_temp_compensation_fahrenheit(self, t_in_fahrenheit: float):
+        """See `ens160.Driver.set_temp_compensation_fahrenheit`."""
+        await self.__call(self.__driver.set_temp_compensation_fahrenheit, t_in_fahrenheit)
+
+    async def set_rh_compensation(self, relative_humidity: float):
+        """See `ens160.Driver.set_rh_compensation`."""
+        await self.__call(self.__driver.set_rh_compensation, relative_humidity)
+
+    async def get_device_status(self) -> Status:
+        """See `ens160.Driver.get_device_status`."""
+        return await self.__call(self.__driver.get_device_status)
+
+    async def configure_interrupt(
+        self,
+        interrupt: IInterrupt,
+        config: InterruptConfig = InterruptConfig.ENABLED
+        | InterruptConfig.NEW_DATA
+        | InterruptConfig.NEW_GPR,
+    ):
+        """See `ens160.Driver.configure_interrupt`."""
+        await self.__call(self.__driver.configure_interrupt, interrupt, config)
+
+    async def wait_for_data(self, timeout: float = 1.0) -> bool:
+        """See `ens160.Driver.wait_for_data`. Without an interrupt the device status
+        is polled with asyncio.sleep between reads."""
+        if self.__driver.interrupt is not None:
+            if await self.__call(self.__driver.data_ready):
+                return True
+            await self.__wait_interrupt(timeout)
+            return await self.__call(self.__driver.data_ready)
+        return await self.__poll(self.__driver.data_ready, monotonic() + timeout)
+
+    async def get_aqi(self) -> int:
+        """See `ens160.Driver.get_aqi`."""
+        return await self.__call(self.__driver.get_aqi)
+
+    async def get_tvoc(self) -> int:
+        """See `ens160.Driver.get_tvoc`."""
+        return await self.__call(self.__driver.get_tvoc)
+
+    async def get_eco2(self) -> int:
+        """See `ens160.Driver.get_eco2`."""
+        return await self.__call(self.__driver.get_eco2)
+
+    async def get_measurements(self) -> tuple[int, int, int]:
+        """See `ens160.Driver.get_measurements`."""
+        return await self.__call(self.__driver.get_measurements)
+
+    async def sample_into(self, buffer) -> tuple[int, int, int]:
+        """See `ens160.Driver.sample_into`."""
+        return await self.__call(self.__driver.sample_into, buffer)
+
+    async def verify_misr(self) -> bool:
+        """See `ens160.Driver.verify_misr`."""
+        return await self.__call(self.__driver.verify_misr)
+
+    async def self_test(self, count: int = 100, bus_khz: int | None = None) -> float:
+        """See `ens160.Driver.self_test`. The reads run back to back in one
+        executor call so the timing is not skewed by the event loop."""
+        return await self.__call(self.__driver.self_test, count, bus_khz)
+
+    async def reset(self):
+        """See `ens160.Driver.reset`."""
+        deadline = monotonic() + Driver.RESET_TIMEOUT
+        await self.set_operating_mode(OpModes.RESET)
+        return await self.__poll(self.__driver.reset_complete, deadline)
+
+    async def init(self):
+        """Reset and set operating mode to IDLE."""
+        await self.reset()
+        await self.set_operating_mode(OpModes.IDLE)
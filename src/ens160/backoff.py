@@ -0,0 +1,12 @@
+"""Exponential backoff helper."""
+
+import random
+
+
+def backoff(initial: float, maximum: float):
+    """Yields exponentially growing delays, starting at initial and capped at
+    maximum, each with up to 50% random jitter added."""
+    delay = initial
+    while True:
+        yield delay + random.uniform(0, delay * 0.5)
+        delay = min(delay * 2, maximum)
@@ -2,13 +2,35 @@
 ENS160 I2C driver
 """
 
-from time import sleep
+import struct
+import warnings
+from time import monotonic, perf_counter, sleep
 
+from .backoff import backoff
 from .commands import Commands
 from .icommunication import ICommunication
+from .iinterrupt import IInterrupt
+from .interrupt_config import InterruptConfig
+from .misr import update_misr
 from .op_modes import OpModes
 from .registers import Registers
-from .status import Status
+from .status import Status, STATUS_CACHE
+
+# Plain int copies of the registers read on every sample, so the hot path
+# does not go through IntEnum conversion on each transfer.
+_REG_DEVICE_STATUS = int(Registers.DEVICE_STATUS)
+_REG_DATA_AQI = int(Registers.DATA_AQI)
+_REG_DATA_TVOC = int(Registers.DATA_TVOC)
+_REG_DATA_ECO2 = int(Registers.DATA_ECO2)
+
+# TEMP_IN is Kelvin * 64; Celsius and Fahrenheit conversions folded into that.
+_CELCIUS_OFFSET = 273.15 * 64
+_FAHRENHEIT_SCALE = 64 * 5 / 9
+_FAHRENHEIT_OFFSET = (273.15 - 32 * 5 / 9) * 64
+
+# Clock cycles on the wire for a single register read: start, address+W,
+# register, repeated start, address+R, data and stop.
+_REGISTER_READ_BITS = 38
 
 class Driver:
     """ENS160 Sensor class."""
@@ -16,6 +38,12 @@ class Driver:
     PART_ID = 0x160
     """The PART_ID as of the ENS160."""
 
+    FW_VERSION_TIMEOUT = 1.0
+    """Seconds `get_fw_version` waits for the device to answer."""
+
+    RESET_TIMEOUT = 0.25
+    """Seconds `reset` waits for the device to reach OpModes.DEEP_SLEEP."""
+
     def __init__(self, communication: ICommunication):
         """Constructor for the class which takes an `ens160.ICommunication` object
         to provide the communications.
@@ -26,6 +54,20 @@ class Driver:
         The ENS160 can be configured to use I2C addresses 0x52 or 0x53.
         """
         self.__i2c = communication
+        self.__interrupt = None
+        self.__misr = None
+
+    @staticmethod
+    def __poll(condition, deadline: float) -> bool:
+        """Calls condition with exponential backoff until it returns True or
+        time.monotonic() passes deadline. Returns the last result."""
+        for delay in backoff(0.001, 0.05):
+            if condition():
+                return True
+            if monotonic() > deadline:
+                return False
+            sleep(delay)
+        return False
 
     def set_operating_mode(self, mode: OpModes):
         """Sets the ENS160 operation mode. Returns True on success.
@@ -33,7 +75,7 @@ class Driver:
         Note that get_part_id and get_fw_version will only work in
         OpModes.IDLE.
         """
-        self.__i2c.write(Registers.OP_MODE, mode)
+        self.__i2c.write_byte(Registers.OP_MODE, mode)
 
     def get_operating_mode(self) -> OpModes:
         """Returns one of the ENS160_OP_MODE values."""
@@ -44,25 +86,43 @@ class Driver:
 
         Expecting 0x0160. Note that this only works in OpModes.IDLE."""
         byte_values = self.__i2c.read(Registers.PART_ID, 2)
-        return byte_values[0] + (byte_values[1] << 8)
+        return int.from_bytes(byte_values, "little")
 
     def clear_gp_read_flag(self):
         """Clears the General Purpose Read bit of the device status."""
         # this command appears to not work.
         # self.__i2c.write(Register.COMMAND, Commands.CLEAR_GPR_READ)
         # just read anything to clear the flag.
-        self.__i2c.read(Registers.GRP_READ4, 3)
+        self.__i2c.read(Registers.GRP_READ4, 1)
 
     def get_fw_version(self) -> str:
         """Returns a string of firmware version in Major.Minor.Release format.
 
-        For example: 5.4.6."""
-        self.__i2c.write(Registers.COMMAND, Commands.GET_FW_VER)
-        while True:
-            status = self.get_device_status()
-            if status.new_gpr:
-                break
-            sleep(0.001)
+        For example: 5.4.6.
+
+        Raises TimeoutError if the device does not answer within
+        `FW_VERSION_TIMEOUT` seconds."""
+        deadline = monotonic() + self.FW_VERSION_TIMEOUT
+        self.request_fw_version()
+        if self.__interrupt is not None:
+            self.__interrupt.wait(self.FW_VERSION_TIMEOUT)
+        if not self.__poll(self.fw_version_ready, deadline):
+            raise TimeoutError("ENS160 did not report the firmware version.")
+        return self.read_fw_version()
+
+    def request_fw_version(self):
+        """Asks the device for its firmware version, the first step of
+        `get_fw_version`."""
+        self.__i2c.write_byte(Registers.COMMAND, Commands.GET_FW_VER)
+
+    def fw_version_ready(self) -> bool:
+        """Returns True once the firmware version requested with
+        `request_fw_version` can be read."""
+        return self.get_device_status().new_gpr
+
+    def read_fw_version(self) -> str:
+        """Reads the firmware version requested with `request_fw_version`, in
+        Major.Minor.Release format."""
         byte_data = self.__i2c.read(Registers.GRP_READ4, 3)
         return f"{byte_data[0]}.{byte_data[1]}.{byte_data[2]}"
 
@@ -73,10 +133,7 @@ class Driver:
         Note: set temperature and humidity compensation values before reading data,
         otherwise you get zeros."""
         param: int = round(t_in_kelvin * 64)
-        params: list[int] = []
-        params.append(param & 0x00FF)
-        params.append((param & 0xFF00) >> 8)
-        self.__i2c.write(Registers.TEMP_IN, params)
+        self.__i2c.write_block(Registers.TEMP_IN, struct.pack("<H", param))
 
     def set_temp_compensation_celcius(self, t_in_celcius: float):
         """Sets the compensation temperature. The sensor will adjust the
@@ -85,7 +142,8 @@ class Driver:
         Note: set temperature and humidity compensation values before reading data,
         otherwise you get zeros."""
 
-        self.set_temp_compensation_kelvin(t_in_celcius + 273.15)
+        param: int = round(t_in_celcius * 64 + _CELCIUS_OFFSET)
+        self.__i2c.write_block(Registers.TEMP_IN, struct.pack("<H", param))
 
     def set_temp_compensation_fahrenheit(self, t_in_fahrenheit: float):
         """Sets the compensation temperature. The sensor will adjust the
@@ -94,7 +152,8 @@ class Driver:
         Note: set temperature and humidity compensation values before reading data,
         otherwise you get zeros."""
 
-        self.set_temp_compensation_celcius((t_in_fahrenheit - 32.0) * 5.0 / 9.0)
+        param: int = round(t_in_fahrenheit * _FAHRENHEIT_SCALE + _FAHRENHEIT_OFFSET)
+        self.__i2c.write_block(Registers.TEMP_IN, struct.pack("<H", param))
 
     def set_rh_compensation(self, relative_humidity: float):
         """Sets the compensation humidity. The sensor will adjust the
@@ -104,27 +163,68 @@ class Driver:
         otherwise you get zeros."""
 
         param: int = round(relative_humidity * 512)
-        params: list[int] = []
-        params.append(param & 0x00FF)
-        params.append((param & 0xFF00) >> 8)
-        self.__i2c.write(Registers.RH_IN, params)
+        self.__i2c.write_block(Registers.RH_IN, struct.pack("<H", param))
 
     def get_device_status(self) -> Status:
         """Get the device status."""
-        return Status(self.__i2c.read(Registers.DEVICE_STATUS, 1))
+        return STATUS_CACHE[self.__i2c.read(_REG_DEVICE_STATUS, 1)]
+
+    def configure_interrupt(
+        self,
+        interrupt: IInterrupt,
+        config: InterruptConfig = InterruptConfig.ENABLED
+        | InterruptConfig.NEW_DATA
+        | InterruptConfig.NEW_GPR,
+    ):
+        """Enables the INTn pin and waits on interrupt instead of polling the
+        device status in `wait_for_data` and `get_fw_version`.
+
+        For example `ens160.gpio.GpiodInterrupt` for the GPIO line wired to INTn,
+        which expects the default active low, open drain configuration."""
+        self.__i2c.write_byte(Registers.CONFIG, config)
+        self.__interrupt = interrupt
+
+    @property
+    def interrupt(self) -> IInterrupt | None:
+        """The interrupt set with `configure_interrupt`, or None."""
+        return self.__interrupt
+
+    def wait_for_data(self, timeout: float = 1.0) -> bool:
+        """Waits up to timeout seconds for new data. Returns True if new data is
+        available.
+
+        Blocks on the interrupt pin when `configure_interrupt` was called and no
+        data is pending yet, otherwise polls the device status."""
+        if self.__interrupt is not None:
+            # INTn stays asserted until the data is read, so data that is
+            # already pending produces no new edge.
+            if self.data_ready():
+                return True
+            self.__interrupt.wait(timeout)
+            return self.data_ready()
+        return self.__poll(self.data_ready, monotonic() + timeout)
+
+    def data_ready(self) -> bool:
+        """Returns True if new data is available to read."""
+        return self.get_device_status().new_data
 
     def get_aqi(self) -> int:
         """Get the Air Quality index.
 
         Possible value are 1,2,3,4 or 5. With 1 being great and 5 being worst."""
-        return self.__i2c.read(Registers.DATA_AQI, 1) & 0x07
+        aqi = self.__i2c.read(_REG_DATA_AQI, 1)
+        if self.__misr is not None:
+            self.__misr = update_misr(self.__misr, (aqi,))
+        return aqi & 0x07
 
     def get_tvoc(self) -> int:
         """Get the Total Volatile Organic compounds in the air in ppb. Lower is
         better air quality.
         """
-        byte_values = self.__i2c.read(Registers.DATA_TVOC, 2)
-        return byte_values[0] + (byte_values[1] << 8)
+        byte_values = self.__i2c.read(_REG_DATA_TVOC, 2)
+        if self.__misr is not None:
+            self.__misr = update_misr(self.__misr, byte_values)
+        return int.from_bytes(byte_values, "little")
 
     def get_eco2(self) -> int:
         """Get the eCO2 levels in the air in ppm.
@@ -138,23 +238,88 @@ class Driver:
         |1500 +      | ppm  | Bad       | Heavily contaminated indoor air, ventilation required.
 
         """
-        byte_values = self.__i2c.read(Registers.DATA_ECO2, 2)
-        return byte_values[0] + (byte_values[1] << 8)
+        byte_values = self.__i2c.read(_REG_DATA_ECO2, 2)
+        if self.__misr is not None:
+            self.__misr = update_misr(self.__misr, byte_values)
+        return int.from_bytes(byte_values, "little")
+
+    def get_measurements(self) -> tuple[int, int, int]:
+        """Get the AQI, TVOC (ppb) and eCO2 (ppm) values in a single block read.
+
+        Equivalent to calling `get_aqi`, `get_tvoc` and `get_eco2` but uses one
+        I2C transaction instead of three."""
+        byte_values = self.__i2c.read(_REG_DATA_AQI, 5)
+        if self.__misr is not None:
+            self.__misr = update_misr(self.__misr, byte_values)
+        aqi, tvoc, eco2 = struct.unpack_from("<BHH", bytes(byte_values))
+        return aqi & 0x07, tvoc, eco2
+
+    def sample_into(self, buffer) -> tuple[int, int, int]:
+        """Reads the measurements and appends them, stamped with time.monotonic(),
+        to an `ens160.sample_buffer.SampleBuffer`. Returns the measurements."""
+        measurements = self.get_measurements()
+        buffer.append(monotonic(), *measurements)
+        return measurements
+
+    def verify_misr(self) -> bool:
+        """Debug helper that checks the data read so far arrived intact.
+
+        Compares DATA_MISR, the checksum the ENS160 keeps over every byte read
+        from its DATA registers, against the one calculated over the bytes this
+        driver received. Returns True if they match.
+
+        Tracking is off until the first call, which keeps the checksum off
+        the sample path for callers that never verify. The first call only
+        enables tracking and synchronises to the device value, returning True.
+        Later calls check the data read since the previous call and
+        resynchronise."""
+        device_misr = self.__i2c.read(Registers.DATA_MISR, 1)
+        ok = self.__misr is None or device_misr == self.__misr
+        self.__misr = device_misr
+        return ok
+
+    def self_test(self, count: int = 100, bus_khz: int | None = None) -> float:
+        """Times count back to back `get_device_status` calls and returns the
+        average seconds per call.
+
+        Issues a RuntimeWarning when the reads are much slower than a bus
+        running at bus_khz would allow, which usually means the bus is still at
+        the 100kHz default. bus_khz defaults to the clock reported by
+        `ens160.ICommunication.get_bus_khz`, or 400kHz if the transport does
+        not know it."""
+        if bus_khz is None:
+            bus_khz = self.__i2c.get_bus_khz() or 400
+        start = perf_counter()
+        for _ in range(count):
+            self.get_device_status()
+        per_read = (perf_counter() - start) / count
+        expected = _REGISTER_READ_BITS / (bus_khz * 1000)
+        if per_read > 3 * expected:
+            warnings.warn(
+                f"{per_read * 1e6:.0f}us per register read, "
+                f"expected about {expected * 1e6:.0f}us at {bus_khz}kHz.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        return per_read
 
     def reset(self):
         """Reset the unit.
 
         Sets the operating mode to OpModes.RESET and then waits for OpModes.DEEP_SLEEP.
+        Returns False if the device did not reach OpModes.DEEP_SLEEP in time.
         """
         self.set_operating_mode(OpModes.RESET)
-        i = 25
-        while i > 0:
-            m = self.get_operating_mode()
-            if m == 0:
-                self.clear_gp_read_flag()
-                return True
-            sleep(0.01)
-        return False
+        return self.__poll(self.reset_complete, monotonic() + self.RESET_TIMEOUT)
+
+    def reset_complete(self) -> bool:
+        """Probes a reset started by `reset`. Returns True once the device is in
+        OpModes.DEEP_SLEEP.
+
+        Reads the operating mode and clears the General Purpose Read flag in
+        one batched transfer."""
+        op_mode, _ = self.__i2c.read_many([(Registers.OP_MODE, 1), (Registers.GRP_READ4, 1)])
+        return op_mode[0] == OpModes.DEEP_SLEEP
 
     def init(self):
         """Reset and set operating mode to IDLE."""
@@ -0,0 +1,40 @@
+"""GPIO interrupt pin using libgpiod."""
+
+import sys
+
+try:
+    import gpiod
+    from gpiod.line import Bias, Edge
+except ModuleNotFoundError as e:
+    # pylint: disable-next=invalid-name
+    gpiod = None
+
+from . import IInterrupt
+
+
+class GpiodInterrupt(IInterrupt):
+    """Waits for falling edges on the GPIO line wired to the active low,
+    open drain INTn pin of the ENS160."""
+
+    def __init__(self, pin: int, chip: str = "/dev/gpiochip0"):
+        if gpiod is None:
+            print(f"Warning gpiod not found, please install it. {chip}")
+            sys.exit(-1)
+        self.__request = gpiod.request_lines(
+            chip,
+            consumer="ens160",
+            config={
+                pin: gpiod.LineSettings(edge_detection=Edge.FALLING, bias=Bias.PULL_UP)
+            },
+        )
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a falling edge or timeout seconds pass."""
+        if not self.__request.wait_edge_events(timeout):
+            return False
+        self.__request.read_edge_events()
+        return True
+
+    def close(self):
+        """Release the GPIO line."""
+        self.__request.release()
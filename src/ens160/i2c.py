@@ -1,10 +1,14 @@
 """I2C Retry wrapper."""
 
 from time import sleep
+import errno
+import os
 import sys
+import threading
+import weakref
 
 try:
-    from smbus2 import SMBus
+    from smbus2 import SMBus, i2c_msg
 except ModuleNotFoundError as e:
     NOT_FOUND = True
     # pylint: disable-next=invalid-name missing-function-docstring
@@ -12,8 +16,47 @@ except ModuleNotFoundError as e:
         print(f"Warning smbus2 not found, please install it. {interface}")
         sys.exit(-1)
 
+    # pylint: disable-next=invalid-name
+    i2c_msg = None
+
 
 from . import Registers, ICommunication
+from .backoff import backoff
+
+_TRANSIENT_ERRORS = {errno.EIO, errno.EREMOTEIO, errno.ENXIO, errno.EAGAIN, errno.ETIMEDOUT}
+"""OSError numbers caused by bus glitches (NACK, arbitration loss, clock
+stretch timeout) that are worth retrying."""
+
+
+class _SharedBus:
+    """An open SMBus and the lock serialising transfers on it.
+
+    smbus2 selects the device address with a separate ioctl before SMBus
+    byte and block transfers, so devices sharing the handle must not
+    interleave transfers from different threads."""
+
+    def __init__(self, interface_id: int):
+        self.smbus = SMBus(interface_id)
+        self.lock = threading.Lock()
+        weakref.finalize(self, os.close, self.smbus.fd)
+
+
+_BUS_CACHE = weakref.WeakValueDictionary()
+"""Open buses by interface id, shared by all devices on that bus."""
+
+_BUS_CACHE_LOCK = threading.Lock()
+"""Makes looking up and opening a shared bus atomic."""
+
+
+def _open_bus(interface_id: int) -> _SharedBus:
+    """Returns the shared bus for interface_id, opening it if needed. The
+    file descriptor is closed once no device references the bus anymore."""
+    with _BUS_CACHE_LOCK:
+        bus = _BUS_CACHE.get(interface_id)
+        if bus is None:
+            bus = _SharedBus(interface_id)
+            _BUS_CACHE[interface_id] = bus
+        return bus
 
 
 class SMBusRetryingI2C(ICommunication):
@@ -24,39 +67,96 @@ class SMBusRetryingI2C(ICommunication):
         address: int,
         interface_id: int,
         retries: int = 5,
-        retry_sleep: float = 0.01,
+        retry_sleep: float = 0.001,
+        retry_sleep_max: float = 0.05,
     ):
-        self.__i2c = SMBus(interface_id)
+        """Retries back off exponentially with jitter, starting at retry_sleep
+        seconds and capped at retry_sleep_max seconds.
+
+        SMBus Packet Error Checking is deliberately not offered. The ENS160
+        datasheet does not document PEC, and a device without it stores the
+        CRC byte in the next register. Use `ens160.Driver.verify_misr` to
+        check data integrity."""
+        self.__bus = _open_bus(interface_id)
+        self.__interface_id = interface_id
         self.__address = address
         self.__retries = retries
         self.__retry_sleep = retry_sleep
+        self.__retry_sleep_max = retry_sleep_max
+
+    def close(self):
+        """Releases this device's reference to the bus. The bus itself is
+        closed when the last device using it is closed or garbage collected.
+        Transfers after close raise ValueError."""
+        self.__bus = None
 
-    def write(self, register: Registers, data: list[int] | int):
-        """Write data to the I2C bus."""
+    def get_bus_khz(self) -> int | None:
+        """Returns the bus clock in kHz as configured in the device tree, or None
+        if the platform does not expose it.
+
+        The ENS160 supports Fast-Mode (400kHz). On a Raspberry Pi enable it with
+        dtparam=i2c_arm_baudrate=400000 in /boot/firmware/config.txt."""
+        path = f"/sys/class/i2c-adapter/i2c-{self.__interface_id}/of_node/clock-frequency"
+        try:
+            with open(path, "rb") as file:
+                return int.from_bytes(file.read(4), "big") // 1000
+        except OSError:
+            return None
+
+    def __retry(self, transfer: str, *args):
+        """Calls the SMBus method named transfer with args while holding the bus
+        lock, retrying transient bus errors. Other errors, such as a closed
+        file descriptor, are raised immediately."""
+        bus = self.__bus
+        if bus is None:
+            raise ValueError("bus closed")
+        transfer = getattr(bus.smbus, transfer)
+        lock = bus.lock
         retries = self.__retries
+        delays = backoff(self.__retry_sleep, self.__retry_sleep_max)
         while True:
             try:
-                if isinstance(data, int):
-                    self.__i2c.write_byte_data(self.__address, register, data)
-                else:
-                    self.__i2c.write_i2c_block_data(self.__address, register, data)
-                return
+                with lock:
+                    return transfer(*args)
             except OSError as error:
                 retries -= 1
-                if retries < 0:
+                if retries < 0 or error.errno not in _TRANSIENT_ERRORS:
                     raise error
-                sleep(self.__retry_sleep)
+                sleep(next(delays))
+
+    def write_byte(self, register: Registers, value: int):
+        """Write a single byte to the I2C bus."""
+        self.__retry("write_byte_data", self.__address, int(register), int(value))
+
+    def write_block(self, register: Registers, data: bytes | list[int]):
+        """Write a block of data to the I2C bus."""
+        self.__retry("write_i2c_block_data", self.__address, int(register), data)
 
     def read(self, register: Registers, size: int):
-        """Read data from the I2C bus."""
-        retries = self.__retries
-        while True:
-            try:
-                if size == 1:
-                    return self.__i2c.read_byte_data(self.__address, register)
-                return self.__i2c.read_i2c_block_data(self.__address, register, size)
-            except OSError as error:
-                retries -= 1
-                if retries < 0:
-                    raise error
-                sleep(self.__retry_sleep)
+        """Read data from the I2C bus. Returns an int for single byte reads and
+        bytes otherwise."""
+        data = self.write_read(register, [], size)
+        if size == 1:
+            return data[0]
+        return data
+
+    def write_read(self, register: Registers, wdata: list[int], rsize: int) -> bytes:
+        """Write wdata starting at register, then read rsize bytes using a
+        repeated start instead of a separate STOP/START transaction."""
+        msg_w = i2c_msg.write(self.__address, [int(register)] + list(wdata))
+        msg_r = i2c_msg.read(self.__address, rsize)
+        self.__retry("i2c_rdwr", msg_w, msg_r)
+        return bytes(msg_r)
+
+    def read_many(self, requests: list[tuple[Registers, int]]) -> list[bytes]:
+        """Read several (register, size) blocks, issuing all write/read message
+        pairs in a single i2c_rdwr call."""
+        msgs = []
+        reads = []
+        for register, size in requests:
+            msg_r = i2c_msg.read(self.__address, size)
+            msgs.append(i2c_msg.write(self.__address, [int(register)]))
+            msgs.append(msg_r)
+            reads.append(msg_r)
+        self.__retry("i2c_rdwr", *msgs)
+        return [bytes(msg_r) for msg_r in reads]
@@ -4,10 +4,54 @@ from .registers import Registers
 
 # pylint: disable-next=missing-class-docstring
 class ICommunication:
-    def write(self, register: Registers, data: list[int] | int):
-        """Write byte data to register."""
-        raise NotImplementedError
+    def write(self, register: Registers, data: bytes | list[int] | int):
+        """Write byte data to register, dispatching to `write_byte` or `write_block`."""
+        if isinstance(data, int):
+            self.write_byte(register, data)
+        else:
+            self.write_block(register, data)
+
+    def write_byte(self, register: Registers, value: int):
+        """Write a single byte to register.
+
+        Defaults to `write` for implementations that only override that."""
+        if type(self).write is ICommunication.write:
+            raise NotImplementedError
+        self.write(register, value)
+
+    def write_block(self, register: Registers, data: bytes | list[int]):
+        """Write a block of bytes, any bytes-like object or list of ints, starting at register.
+
+        Defaults to `write` for implementations that only override that."""
+        if type(self).write is ICommunication.write:
+            raise NotImplementedError
+        self.write(register, list(data))
+
+    def get_bus_khz(self) -> int | None:
+        """Returns the bus clock in kHz, or None if the transport does not know it."""
+        return None
 
     def read(self, register: Registers, size: int):
-        """Read byte data from register."""
+        """Read byte data from register. Returns an int when size is 1 and
+        bytes otherwise."""
         raise NotImplementedError
+
+    def write_read(self, register: Registers, wdata: list[int], rsize: int) -> bytes:
+        """Write wdata starting at register and read rsize bytes back in a
+        single combined transaction.
+
+        Defaults to a `write_block` followed by a separate `read`."""
+        if wdata:
+            self.write_block(register, wdata)
+        data = self.read(register + len(wdata), rsize)
+        return bytes([data]) if isinstance(data, int) else bytes(data)
+
+    def read_many(self, requests: list[tuple[Registers, int]]) -> list[bytes]:
+        """Read several (register, size) blocks in one batched transfer.
+
+        Defaults to one `read` per block."""
+        results = []
+        for register, size in requests:
+            data = self.read(register, size)
+            results.append(bytes([data]) if isinstance(data, int) else bytes(data))
+        return results
@@ -0,0 +1,8 @@
+"""Interface for interrupt pin classes"""
+
+# pylint: disable-next=missing-class-docstring
+class IInterrupt:
+    def wait(self, timeout: float) -> bool:
+        """Block until the INTn pin asserts or timeout seconds pass. Returns
+        True if the pin asserted."""
+        raise NotImplementedError
@@ -0,0 +1,18 @@
+"""Interrupt Pin Configuration Constants."""
+
+from enum import IntFlag
+
+# pylint: disable-next=missing-class-docstring
+class InterruptConfig(IntFlag):
+    DISABLED = 0x00
+    """INTn pin disabled."""
+    ENABLED = 0x01
+    """INTn pin enabled."""
+    NEW_DATA = 0x02
+    """Assert INTn when new data is available in the DATA registers."""
+    NEW_GPR = 0x08
+    """Assert INTn when new data is available in the General Purpose Read registers."""
+    PUSH_PULL = 0x20
+    """Drive INTn push/pull instead of open drain."""
+    ACTIVE_HIGH = 0x40
+    """INTn is active high instead of active low."""
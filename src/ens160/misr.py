@@ -0,0 +1,16 @@
+"""Data integrity (DATA_MISR) calculation."""
+
+MISR_POLY = 0x1D
+"""MISR polynomial x^8 + x^4 + x^3 + x^2 + 1."""
+
+
+_MISR_SHIFT = tuple(((m << 1) & 0xFF) ^ (MISR_POLY if m & 0x80 else 0) for m in range(256))
+"""The MISR shifted by one bit and reduced by the polynomial, indexed by MISR."""
+
+
+def update_misr(misr: int, data) -> int:
+    """Returns the MISR after feeding it the bytes in data, the way the ENS160
+    updates DATA_MISR for every byte read from its DATA registers."""
+    for byte in data:
+        misr = _MISR_SHIFT[misr] ^ byte
+    return misr
@@ -1,6 +1,7 @@
 """Mock ENS160 wrapper."""
 
-from . import Commands, Registers, OpModes, Status, ICommunication
+from . import Commands, Registers, OpModes, ICommunication
+from .misr import update_misr
 
 
 class MockENS160(ICommunication):
@@ -10,8 +11,7 @@ class MockENS160(ICommunication):
         self,
     ):
         self.__op_mode = 0
-        self.__status = Status(0)
-        self.__status.power_on = True
+        self.__status = 0x80
         self.__registers = {}
         self.__registers[Registers.PART_ID] = 0x60
         self.__registers[Registers.PART_ID + 1] = 0x01
@@ -24,21 +24,22 @@ class MockENS160(ICommunication):
         self.__registers[Registers.GRP_READ5] = 0
         self.__registers[Registers.GRP_READ6] = 0
         self.__delay = 5
+        self.__misr = 0
 
     def __handle_command(self, command: int):
         if command == Commands.GET_FW_VER:
             self.__registers[Registers.GRP_READ4] = 1
             self.__registers[Registers.GRP_READ5] = 2
             self.__registers[Registers.GRP_READ6] = 3
-            self.__status.new_gpr = True
+            self.__status |= 0x01
         if command == Commands.CLEAR_GPR_READ:
-            self.__status.new_gpr = False
+            self.__status &= ~0x01
 
     def __handle_status(self):
-        if self.__op_mode == OpModes.STANDARD and not self.__status.new_data:
+        if self.__op_mode == OpModes.STANDARD and not self.__status & 0x02:
             self.__delay -= 1
             if self.__delay == 0:
-                self.__status.new_data = 1
+                self.__status |= 0x02
                 self.__registers[Registers.DATA_AQI] = 1
                 self.__registers[Registers.DATA_ECO2] = 50
                 self.__registers[Registers.DATA_ECO2 + 1] = 0
@@ -46,7 +47,7 @@ class MockENS160(ICommunication):
                 self.__registers[Registers.DATA_TVOC + 1] = 0
                 self.__delay = 5
 
-        return self.__status.to_status()
+        return self.__status
 
     def __handle_opmode(self, mode: int):
         if mode == OpModes.RESET:
@@ -59,19 +60,26 @@ class MockENS160(ICommunication):
         for i in range(size):
             results.append(self.__registers[register + i])
 
+        if Registers.DATA_AQI <= register < Registers.DATA_MISR:
+            self.__misr = update_misr(self.__misr, results)
+
         # clear the flag.
         if register in [Registers.DATA_AQI, Registers.DATA_ECO2, Registers.DATA_TVOC]:
-            self.__status.new_data = 0
+            self.__status &= ~0x02
+        if Registers.GRP_READ0 <= register <= Registers.GRP_READ7:
+            self.__status &= ~0x01
 
-        return results
+        return bytes(results)
 
-    def write(self, register: Registers, data: list[int] | int):
-        """Write data to the I2C bus."""
-        if isinstance(data, int):
-            if self.__op_mode == 1 and register == Registers.COMMAND:
-                self.__handle_command(data)
-            if register == Registers.OP_MODE:
-                self.__handle_opmode(data)
+    def write_byte(self, register: Registers, value: int):
+        """Write a single byte to the I2C bus."""
+        if self.__op_mode == 1 and register == Registers.COMMAND:
+            self.__handle_command(value)
+        if register == Registers.OP_MODE:
+            self.__handle_opmode(value)
+
+    def write_block(self, register: Registers, data: bytes | list[int]):
+        """Write a block of data to the I2C bus, ignored by the simulation."""
 
     def read(self, register: Registers, size: int):
         """Read data from the I2C bus."""
@@ -80,6 +88,8 @@ class MockENS160(ICommunication):
                 return self.__handle_status()
             if register == Registers.OP_MODE:
                 return self.__op_mode
-            return self.__registers[register]
+            if register == Registers.DATA_MISR:
+                return self.__misr
+            return self.__read_register(register, 1)[0]
 
         return self.__read_register(register, size)
@@ -0,0 +1,51 @@
+"""Column oriented sample storage."""
+
+import sys
+
+try:
+    import numpy as np
+except ModuleNotFoundError as e:
+    # pylint: disable-next=invalid-name
+    np = None
+
+
+class SampleBuffer:
+    """Fixed size buffer that stores timestamped measurements as one numpy
+    array per field, 13 bytes per sample, instead of a list of tuples."""
+
+    def __init__(self, size: int):
+        """Allocates room for size samples."""
+        if np is None:
+            print("Warning numpy not found, please install it.")
+            sys.exit(-1)
+        self.t = np.empty(size, "f8")
+        """Sample time in seconds, from time.monotonic()."""
+        self.aqi = np.empty(size, "u1")
+        """Air Quality Index."""
+        self.tvoc = np.empty(size, "u2")
+        """TVOC in ppb."""
+        self.eco2 = np.empty(size, "u2")
+        """eCO2 in ppm."""
+        self.i = 0
+        """Number of samples stored."""
+
+    def __len__(self):
+        return self.i
+
+    def append(self, t: float, aqi: int, tvoc: int, eco2: int):
+        """Stores a sample. Raises IndexError when the buffer is full."""
+        i = self.i
+        self.t[i] = t
+        self.aqi[i] = aqi
+        self.tvoc[i] = tvoc
+        self.eco2[i] = eco2
+        self.i = i + 1
+
+    def as_recarray(self):
+        """Returns the stored samples as a numpy record array with the fields
+        t, aqi, tvoc and eco2."""
+        i = self.i
+        return np.rec.fromarrays(
+            [self.t[:i], self.aqi[:i], self.tvoc[:i], self.eco2[:i]],
+            names="t,aqi,tvoc,eco2",
+        )
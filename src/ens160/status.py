@@ -2,25 +2,56 @@
 
 # pylint: disable-next=missing-class-docstring
 class Status:
+    __slots__ = ("__d",)
+
     def __init__(self, d):
         """Initializes structure from byte value."""
-        self.__flags = (d & 0x0C) >> 2
-        self.warm_up = self.__flags == 1
+        self.__d = d
+
+    @property
+    def flags(self) -> int:
+        """Validity flag: 0 normal operation, 1 warm up, 2 initial start up, 3 invalid data."""
+        return (self.__d & 0x0C) >> 2
+
+    @property
+    def warm_up(self) -> bool:
         """Set during first 3 minutes after power-on"""
-        self.inital_startup = self.__flags == 2
+        return (self.__d & 0x0C) == 0x04
+
+    @property
+    def inital_startup(self) -> bool:
         """Set during first full hour of operation after initial power-on24."""
-        self.normal_operation = self.__flags == 0
+        return (self.__d & 0x0C) == 0x08
+
+    @property
+    def normal_operation(self) -> bool:
         """Set if in standard operating mode."""
-        self.invalid_data = self.__flags == 3
+        return (self.__d & 0x0C) == 0x00
+
+    @property
+    def invalid_data(self) -> bool:
         """Set if signals give unexpected values (very high or very low). Multiple sensors out of range."""
-        self.power_on = (d & 0x80) == 0x80
+        return (self.__d & 0x0C) == 0x0C
+
+    @property
+    def power_on(self) -> bool:
         """Set if the unit is not in deep_sleep."""
-        self.error = (d & 0x40) == 0x40
+        return (self.__d & 0x80) == 0x80
+
+    @property
+    def error(self) -> bool:
         """Set if an error has occurred."""
-        self.new_data = (d & 0x02) == 0x02
+        return (self.__d & 0x40) == 0x40
+
+    @property
+    def new_data(self) -> bool:
         """Set if data is available to read, automatically cleared after a read."""
-        self.new_gpr = (d & 0x01) == 0x01
+        return (self.__d & 0x02) == 0x02
+
+    @property
+    def new_gpr(self) -> bool:
         """Set if new general purpose data is available, automatically cleared after a read."""
+        return (self.__d & 0x01) == 0x01
 
     def __str__(self):
         # pylint: disable=line-too-long
@@ -28,13 +59,8 @@ class Status:
 
     def to_status(self):
         """Returns the byte value corresponding to the current value of the flags"""
-        self.__flags = (
-            self.warm_up * 1 | self.inital_startup * 2 | self.invalid_data * 3
-        )
-        return (
-            self.new_gpr
-            | self.new_data << 1
-            | self.__flags << 2
-            | self.error << 6
-            | self.power_on << 7
-        )
+        return self.__d
+
+
+STATUS_CACHE = tuple(Status(d) for d in range(256))
+"""Pre-decoded `Status` for every possible status byte, indexed by that byte."""
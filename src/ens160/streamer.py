@@ -0,0 +1,82 @@
+"""Background measurement acquisition."""
+
+import threading
+from collections import deque
+from time import monotonic
+
+from .backoff import backoff
+from .driver import Driver
+
+
+class Streamer:
+    """Reads measurements on a daemon thread and keeps the most recent ones,
+    so callers get the latest sample without waiting on the bus.
+
+    The driver must be set up (for example `ens160.Driver.init`, compensation and
+    OpModes.STANDARD) before it is handed over, and must not be used by other
+    threads while the streamer is running."""
+
+    def __init__(self, driver: Driver, interval: float = 1.0, depth: int = 64):
+        """Starts acquisition. interval is the longest time in seconds to wait for
+        new data per iteration, depth the number of samples kept."""
+        self.__driver = driver
+        self.__interval = interval
+        self.__samples = deque(maxlen=depth)
+        self.__error = None
+        self.__stop = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def __run(self):
+        delays = None
+        while not self.__stop.is_set():
+            try:
+                if self.__driver.wait_for_data(self.__interval):
+                    aqi, tvoc, eco2 = self.__driver.get_measurements()
+                    self.__samples.append((monotonic(), aqi, tvoc, eco2))
+            except OSError as error:
+                # Bus errors that outlasted the I2C retries, keep trying.
+                self.__error = error
+                if delays is None:
+                    delays = backoff(0.01, max(self.__interval, 0.01))
+                self.__stop.wait(next(delays))
+                continue
+            # pylint: disable-next=broad-exception-caught
+            except Exception as error:
+                self.__error = error
+                return
+            self.__error = None
+            delays = None
+
+    @property
+    def error(self) -> Exception | None:
+        """The exception from the last failed read, None once a read succeeds.
+
+        Bus errors (OSError) are retried with backoff while the error is
+        set. Any other exception ends acquisition, see `is_alive`."""
+        return self.__error
+
+    def is_alive(self) -> bool:
+        """Returns True while the acquisition thread is running."""
+        return self.__thread.is_alive()
+
+    def latest(self) -> tuple[float, int, int, int] | None:
+        """Returns the most recent (time.monotonic(), aqi, tvoc, eco2) sample, or
+        None if no sample was read yet. Check `error` to see whether reads are
+        currently failing."""
+        try:
+            return self.__samples[-1]
+        except IndexError:
+            return None
+
+    def samples(self) -> list[tuple[float, int, int, int]]:
+        """Returns the stored samples, oldest first."""
+        return list(self.__samples)
+
+    def stop(self):
+        """Stops acquisition and waits for the thread to finish. Raises the
+        exception that ended acquisition early, if any."""
+        self.__stop.set()
+        self.__thread.join()
+        if self.__error is not None and not isinstance(self.__error, OSError):
+            raise self.__error
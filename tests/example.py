@@ -43,8 +43,7 @@ if __name__ == "__main__":
         print(status)
         if status.new_data:
             i += 1
-            print(
-                f"AQI={dev.get_aqi()}, eCO2={dev.get_eco2()}ppm, TVOC={dev.get_tvoc()}ppb"
-            )
+            aqi, tvoc, eco2 = dev.get_measurements()
+            print(f"AQI={aqi}, eCO2={eco2}ppm, TVOC={tvoc}ppb")
         else:
             sleep(0.1)
@@ -0,0 +1,127 @@
+"""Driver tests against the mock ENS160."""
+
+import errno
+import os
+import weakref
+
+import pytest
+
+from ens160 import Commands, Driver, OpModes, Registers
+from ens160 import i2c
+from ens160.misr import MISR_POLY, update_misr
+from ens160.mock import MockENS160
+
+
+def test_clear_gp_read_flag():
+    """A single byte GPR read clears the new_gpr status flag."""
+    mock = MockENS160()
+    dev = Driver(mock)
+    dev.init()
+
+    mock.write_byte(Registers.COMMAND, Commands.GET_FW_VER)
+    assert dev.get_device_status().new_gpr
+
+    dev.clear_gp_read_flag()
+    assert not dev.get_device_status().new_gpr
+
+
+class FakeSMBus:
+    """SMBus stand-in that fails write_byte_data with the queued errnos."""
+
+    errors: list[int] = []
+
+    def __init__(self, _interface_id):
+        self.fd = os.open(os.devnull, os.O_RDWR)
+        self.calls = 0
+
+    def write_byte_data(self, *_args):
+        """Raises the next queued error, succeeds once the queue is empty."""
+        self.calls += 1
+        if FakeSMBus.errors:
+            code = FakeSMBus.errors.pop(0)
+            raise OSError(code, os.strerror(code))
+
+
+@pytest.fixture(name="fake_bus")
+def fixture_fake_bus(monkeypatch):
+    """Routes SMBusRetryingI2C to a fresh FakeSMBus."""
+    monkeypatch.setattr(i2c, "SMBus", FakeSMBus)
+    monkeypatch.setattr(i2c, "_BUS_CACHE", weakref.WeakValueDictionary())
+    FakeSMBus.errors = []
+    dev = i2c.SMBusRetryingI2C(0x53, 1, retries=3, retry_sleep=0, retry_sleep_max=0)
+    return dev, i2c._BUS_CACHE[1].smbus  # pylint: disable=protected-access
+
+
+def test_retry_recovers_from_transient_errors(fake_bus):
+    """Transient errors are retried until the transfer succeeds."""
+    dev, bus = fake_bus
+    FakeSMBus.errors = [errno.EREMOTEIO, errno.EIO]
+    dev.write_byte(Registers.OP_MODE, 1)
+    assert bus.calls == 3
+
+
+def test_retry_gives_up_after_retries(fake_bus):
+    """A persistent transient error is raised after the configured retries."""
+    dev, bus = fake_bus
+    FakeSMBus.errors = [errno.EREMOTEIO] * 10
+    with pytest.raises(OSError) as error:
+        dev.write_byte(Registers.OP_MODE, 1)
+    assert error.value.errno == errno.EREMOTEIO
+    assert bus.calls == 4
+
+
+def test_retry_raises_fatal_errors_immediately(fake_bus):
+    """Errors that retrying cannot fix are raised on the first attempt."""
+    dev, bus = fake_bus
+    FakeSMBus.errors = [errno.EBADF]
+    with pytest.raises(OSError) as error:
+        dev.write_byte(Registers.OP_MODE, 1)
+    assert error.value.errno == errno.EBADF
+    assert bus.calls == 1
+
+
+def test_update_misr_matches_bitwise_definition():
+    """The table driven MISR equals the bit by bit datasheet calculation."""
+    for misr in range(256):
+        for byte in range(256):
+            shifted = ((misr << 1) ^ byte) & 0xFF
+            expected = shifted ^ MISR_POLY if misr & 0x80 else shifted
+            assert update_misr(misr, (byte,)) == expected
+
+
+class CorruptingMock(MockENS160):
+    """Mock that flips a bit in the next measurement block read."""
+
+    corrupt = False
+
+    def read(self, register: Registers, size: int):
+        data = super().read(register, size)
+        if self.corrupt and register == Registers.DATA_AQI and size == 5:
+            self.corrupt = False
+            data = bytes([data[0], data[1] ^ 0x01]) + data[2:]
+        return data
+
+
+def read_sample(dev: Driver):
+    """Waits for and reads one measurement."""
+    assert dev.wait_for_data(1.0)
+    return dev.get_measurements()
+
+
+def test_verify_misr_detects_corruption():
+    """verify_misr passes for intact reads and fails after a corrupted byte."""
+    mock = CorruptingMock()
+    dev = Driver(mock)
+    dev.init()
+    dev.set_operating_mode(OpModes.STANDARD)
+
+    assert dev.verify_misr()
+    read_sample(dev)
+    assert dev.verify_misr()
+
+    mock.corrupt = True
+    read_sample(dev)
+    assert not dev.verify_misr()
+
+    read_sample(dev)
+    assert dev.verify_misr()